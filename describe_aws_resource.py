@@ -5,15 +5,68 @@ Someday rewrite this as a package thing.
 """
 
 import argparse
+import concurrent.futures
 import datetime
+import functools
+import hashlib
 import json
+import os
+import pickle
 import re
 import sys
-
-import boto3
-import botocore
-import botocore.exceptions
-from botocore.config import Config
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ClientError codes that mean the credentials themselves are bad. S3 has its
+# own names for an unknown key or a bad session token.
+CREDENTIAL_ERROR_CODES = (
+    "AuthFailure",
+    "ExpiredToken",
+    "InvalidAccessKeyId",
+    "InvalidClientTokenId",
+    "InvalidToken",
+    "SignatureDoesNotMatch",
+    "UnrecognizedClientException",
+)
+
+S3_URL_RE = re.compile(r"s3://(?P<bucket>[^/]+)/?(?P<key>\S+)?$")
+DNS_NAME_RE = re.compile(r"[-\w]+\.[-\w]+[\.]*")
+
+# Resource id prefix -> (type, sub_type)
+ID_PREFIXES = {
+    "i-": ("ec2", "instance"),
+    "subnet-": ("ec2", "subnet"),
+    "snap-": ("ec2", "snapshot"),
+    "vol-": ("ec2", "volume"),
+    "vpc-": ("ec2", "vpc"),
+}
+
+CACHE_DIR = os.path.expanduser("~/.cache/describe_aws_resource")
+
+# Instance attributes shown when --full isn't given.
+EC2_INSTANCE_ATTRIBUTES = (
+    "InstanceType",
+    "PrivateIpAddress",
+    "SecurityGroups",
+    "SubnetId",
+    "VpcId",
+)
+
+# Route53 only allows 5 requests a second per account. The worker count only
+# caps how many lookups are in flight; route53_throttle() does the spacing.
+ROUTE53_MAX_WORKERS = 4
+ROUTE53_MIN_INTERVAL = 0.2
+route53_lock = threading.Lock()
+route53_next_call = 0.0
+
+# Clients get shared between worker threads, so give them enough connections
+# that the threads don't queue up behind each other.
+MAX_POOL_CONNECTIONS = 32
 
 
 def print_err(m):
@@ -23,24 +76,165 @@ def print_err(m):
 def json_value_converter(o):
     """
     Use this function in the 'default' argument for json.dumps to convert
-    values that are not strings.
+    values that are not strings. Only used when orjson isn't available.
     """
     if isinstance(o, datetime.datetime):
-        return o.__str__()
+        return o.isoformat()
 
 
-def print_json(o):
+@functools.lru_cache(maxsize=None)
+def get_session(profile=None):
+    """
+    Get the boto3 session for the profile. Every client comes from this so
+    the aws config and credentials files are only read once per run.
+    boto3 is imported here so runs that never talk to AWS don't pay for it.
+    """
+    import boto3.session
+
+    return boto3.session.Session(profile_name=profile)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service, region=None, profile=None):
+    """
+    Get a boto3 client for the service, reusing one if we already made it.
+    """
+    from botocore.config import Config
+
+    # We only ever send describe calls built right here, so skip botocore's
+    # client side parameter validation.
+    aws_config = Config(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        parameter_validation=False,
+        retries={"mode": "standard", "max_attempts": 3},
+        tcp_keepalive=True,
+        user_agent_extra="describe_aws_resource/1",
+    )
+    if region is not None:
+        aws_config = aws_config.merge(Config(region_name=region))
+    return get_session(profile).client(service, config=aws_config)
+
+
+def route53_throttle():
     """
-    print out the object as json
+    Wait until it is our turn to call Route53, so calls from all threads are
+    at least ROUTE53_MIN_INTERVAL seconds apart.
     """
-    print(
-        json.dumps(
-            o,
-            default=json_value_converter,
-            sort_keys=True,
-            indent=2,
+    global route53_next_call
+    with route53_lock:
+        now = time.monotonic()
+        call_at = max(now, route53_next_call)
+        route53_next_call = call_at + ROUTE53_MIN_INTERVAL
+    time.sleep(call_at - now)
+
+
+def call_aws(client, operation, **params):
+    """
+    Call client.<operation>(**params), keeping Route53 under its rate limit.
+    """
+    if client.meta.service_model.service_name == "route53":
+        route53_throttle()
+    return getattr(client, operation)(**params)
+
+
+def cached_call(client, operation, cli_args, **params):
+    """
+    Call client.<operation>(**params), keeping the response on disk for
+    --cache-ttl seconds so repeat runs against the same resource skip AWS.
+    """
+    if not cli_args.cache_ttl:
+        return call_aws(client, operation, **params)
+    session = get_session(cli_args.profile)
+    # Credentials from the environment don't come with a profile name and
+    # could be for any account, so key those on the access key as well.
+    # Only for those though: assume-role and SSO keys change every run and
+    # are loaded lazily, so touching them here would cost a round trip.
+    credentials = session.get_credentials()
+    access_key = None
+    if credentials is not None and credentials.method == "env":
+        access_key = credentials.access_key
+    key = repr(
+        (
+            session.profile_name,
+            access_key,
+            client.meta.region_name,
+            client.meta.service_model.service_name,
+            operation,
+            sorted(params.items()),
         )
     )
+    cache_file = os.path.join(
+        CACHE_DIR, hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    )
+    try:
+        cache_stat = os.stat(cache_file)
+        # Only trust files that are ours and that nobody else could have
+        # written, since they get unpickled.
+        private = cache_stat.st_uid == os.getuid() and not cache_stat.st_mode & 0o077
+        fresh = cache_stat.st_mtime > time.time() - cli_args.cache_ttl
+        if private and fresh:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    response = call_aws(client, operation, **params)
+    try:
+        # Responses can hold IPs, tags and the like, keep them private.
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        # Write somewhere else first so a reader never sees half a file.
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(response, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    prune_cache(cli_args.cache_ttl)
+    return response
+
+
+def prune_cache(ttl):
+    """
+    Remove cache entries (and leftover temp files) older than ttl seconds.
+    """
+    expired = time.time() - ttl
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < expired:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def print_json(o):
+    """
+    print out the object as json. Pretty for a terminal, one compact line
+    (so NDJSON for several objects) when the output is piped somewhere.
+    """
+    pretty = sys.stdout.isatty()
+    if orjson is None:
+        if pretty:
+            output = json.dumps(
+                o,
+                default=json_value_converter,
+                sort_keys=True,
+                indent=2,
+            )
+        else:
+            output = json.dumps(o, default=json_value_converter, separators=(",", ":"))
+        output = output.encode()
+    else:
+        option = orjson.OPT_NAIVE_UTC
+        if pretty:
+            option |= orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+        output = orjson.dumps(o, option=option)
+    # Anything already printed has to go out before we write to the buffer.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(output + b"\n")
 
 
 def parse_arn(arn):
@@ -51,31 +245,23 @@ def parse_arn(arn):
     # sample arns
     # arn:aws:ec2:us-east-2:643927032162:subnet/subnet-b93f81d0
     # arn:aws:s3:::mk-flacs
-    arn_matcher = re.compile(
-        r"""
-      ^arn:aws
-      :(?P<service>[^:]+)
-      :(?P<region>[^:]*)
-      :(?P<account>\d*)
-      :(?P<resource>\S+)$
-      """,
-        re.VERBOSE,
-    )
-    if arn_match := arn_matcher.search(arn):
-        arn_dict = arn_match.groupdict()
-        resource["type"] = arn_dict["service"]
-        if arn_dict["service"] == "ec2":
-            (resource["sub_type"], resource["name"]) = arn_dict["resource"].split("/")
-        elif arn_dict["service"] == "rds":
-            (resource["sub_type"], resource["name"]) = arn_dict["resource"].split(":")
-        elif arn_dict["service"] == "s3":
-            resource["sub_type"] = "bucket"
-            resource["name"] = arn_dict["resource"]
-        else:
-            resource["name"] = arn_dict["resource"]
-            resource["sub_type"] = None
-    else:
+    parts = arn.split(":", 5)
+    if len(parts) != 6 or parts[0] != "arn" or parts[1] != "aws":
+        raise ValueError(f"Invalid ARN: {arn}")
+    (_, _, service, _, account, arn_resource) = parts
+    if not service or (account and not account.isdigit()) or not arn_resource:
         raise ValueError(f"Invalid ARN: {arn}")
+    resource["type"] = service
+    if service == "ec2":
+        (resource["sub_type"], resource["name"]) = arn_resource.split("/")
+    elif service == "rds":
+        (resource["sub_type"], resource["name"]) = arn_resource.split(":")
+    elif service == "s3":
+        resource["sub_type"] = "bucket"
+        resource["name"] = arn_resource
+    else:
+        resource["name"] = arn_resource
+        resource["sub_type"] = None
     return resource
 
 
@@ -85,7 +271,7 @@ def parse_s3_url(url):
     included.
     """
     resource = {}
-    if s3_match := re.match(r"s3://(?P<bucket>[^/]+)/?(?P<key>\S+)?$", url):
+    if s3_match := S3_URL_RE.match(url):
         bucket_dict = s3_match.groupdict()
         resource["type"] = "s3"
         if bucket_dict["key"] is None:
@@ -99,19 +285,73 @@ def parse_s3_url(url):
         raise ValueError(f"Invalid S3 URL: {url}")
 
 
-def possible_route53_resource(args):
+def find_route53_record(client, zone_id, dotted_name, cli_args):
+    """
+    Look for a record named dotted_name in the given hosted zone.
+    Returns the first matching record set or None.
+    """
+    # Records come back sorted starting at StartRecordName, so if the name
+    # exists it is at the top of the first page.
+    params = {"HostedZoneId": zone_id, "StartRecordName": dotted_name}
+    while True:
+        response = cached_call(
+            client, "list_resource_record_sets", cli_args, MaxItems="5", **params
+        )
+        for data in response["ResourceRecordSets"]:
+            if data["Name"] == dotted_name:
+                return data
+        if not (
+            response["IsTruncated"] and response.get("NextRecordName") == dotted_name
+        ):
+            return None
+        params["StartRecordType"] = response["NextRecordType"]
+
+
+def find_route53_zones(client, zone_name, cli_args):
+    """
+    Look up the hosted zones named zone_name.
+    Returns them as {zone name: zone id}.
+    """
+    matched = {}
+    # Zones come back sorted starting at DNSName, so the ones we want are at
+    # the top and we can stop at the first zone with a different name.
+    params = {"DNSName": zone_name}
+    while True:
+        response = cached_call(
+            client, "list_hosted_zones_by_name", cli_args, MaxItems="10", **params
+        )
+        for zone in response["HostedZones"]:
+            if zone["Name"] != zone_name:
+                return matched
+            matched[zone["Name"]] = zone["Id"]
+        if not response["IsTruncated"]:
+            return matched
+        params = {
+            "DNSName": response["NextDNSName"],
+            "HostedZoneId": response["NextHostedZoneId"],
+        }
+
+
+def possible_route53_resource(name, args):
     """
     Check if this is a route53 zone or resource name
     """
-    name = args.identifier
     dotted_name = name if name.endswith(".") else name + "."
-    client = boto3.client("route53")
-    all_zones = client.list_hosted_zones(MaxItems="100")["HostedZones"]
-    matched_zones = {
-        zone["Name"]: zone["Id"]
-        for zone in all_zones
-        if dotted_name.endswith(zone["Name"])
-    }
+    client = get_client("route53", profile=args.profile)
+    labels = dotted_name.split(".")[:-1]
+    if "" in labels:
+        return None
+    # The zones this could be in are the name itself and each of its parents,
+    # leaving out the bare TLD.
+    zone_names = [".".join(labels[i:]) + "." for i in range(len(labels) - 1)]
+    matched_zones = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(ROUTE53_MAX_WORKERS, len(zone_names))
+    ) as executor:
+        for zones in executor.map(
+            functools.partial(find_route53_zones, client, cli_args=args), zone_names
+        ):
+            matched_zones.update(zones)
     if dotted_name in matched_zones.keys():
         """Do a zone lookup"""
         print(f"Doing a zone lookup on {dotted_name}") if args.verbose else None
@@ -121,25 +361,34 @@ def possible_route53_resource(args):
             "sub_type": "hosted_zone",
         }
     elif len(matched_zones) > 0:
-        """Lookup the name against the zones here."""
-        for zone_name, zone_id in matched_zones.items():
-            print(
-                f"Checking zone {zone_name} for record {name}"
-            ) if args.verbose else None
-            paginator = client.get_paginator("list_resource_record_sets")
-            page_iterator = paginator.paginate(HostedZoneId=zone_id)
-            filtered_iterator = page_iterator.search(
-                f"ResourceRecordSets[?Name==`{dotted_name}`]"
-            )
-
-            # for page in page_iterator:
-            for data in filtered_iterator:
-                return {
-                    "name": name,
-                    "type": "route53",
-                    "sub_type": "record",
-                    "data": data,
-                }
+        """Lookup the name against the zones here, all at once."""
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(ROUTE53_MAX_WORKERS, len(matched_zones))
+        ) as executor:
+            futures = []
+            # Most specific zone first, so a record that is in a delegated
+            # child zone and its parent always comes from the child.
+            for zone_name, zone_id in sorted(
+                matched_zones.items(), key=lambda z: len(z[0]), reverse=True
+            ):
+                print(
+                    f"Checking zone {zone_name} for record {name}"
+                ) if args.verbose else None
+                futures.append(
+                    executor.submit(
+                        find_route53_record, client, zone_id, dotted_name, args
+                    )
+                )
+            for future in futures:
+                if data := future.result():
+                    for f in futures:
+                        f.cancel()
+                    return {
+                        "name": name,
+                        "type": "route53",
+                        "sub_type": "record",
+                        "data": data,
+                    }
     else:
         return None
 
@@ -148,11 +397,11 @@ def describe_route53_resource(r, client, cli_args):
     """
     Describe a route53 zone or record
     """
-    response = client.get_hosted_zone(Id=r["name"])
+    response = cached_call(client, "get_hosted_zone", cli_args, Id=r["name"])
     return response["HostedZone"]
 
 
-def determine_resource_type(args):
+def determine_resource_type(identifier, args):
     """
     Determine what type of AWS resource this is and what its name is.
     This will help us determine what method to use to describe this resource.
@@ -162,7 +411,6 @@ def determine_resource_type(args):
         "sub-type": None,
         "name": "unknown",
     }
-    identifier = args.identifier
     print(f"Parsing {identifier}") if args.verbose else None
     if identifier.startswith("arn:"):
         print("It's an ARN.") if args.verbose else None
@@ -172,25 +420,16 @@ def determine_resource_type(args):
         resource = parse_s3_url(identifier)
     else:
         resource["name"] = identifier
-        if re.match("i-", identifier):
-            resource["type"] = "ec2"
-            resource["sub_type"] = "instance"
-        elif re.match("subnet-", identifier):
-            resource["type"] = "ec2"
-            resource["sub_type"] = "subnet"
-        elif re.match("snap-", identifier):
-            resource["type"] = "ec2"
-            resource["sub_type"] = "snapshot"
-        elif re.match("vol-", identifier):
-            resource["type"] = "ec2"
-            resource["sub_type"] = "volume"
-        elif re.match("vpc-", identifier):
-            resource["type"] = "ec2"
-            resource["sub_type"] = "vpc"
-        elif re.match(r"[-\w]+\.[-\w]+[\.]*", identifier):
-            resource = possible_route53_resource(args)
+        for prefix, (resource_type, sub_type) in ID_PREFIXES.items():
+            if identifier.startswith(prefix):
+                resource["type"] = resource_type
+                resource["sub_type"] = sub_type
+                break
         else:
-            resource = None
+            if DNS_NAME_RE.match(identifier):
+                resource = possible_route53_resource(identifier, args)
+            else:
+                resource = None
 
     if resource:
         return resource
@@ -204,103 +443,137 @@ def determine_resource_type(args):
 
 def describe_ec2_resource(r, client, cli_args):
     """
-    Describe an ec2 type resource
+    Describe ec2 type resources. r["name"] is a list of ids that all have
+    the same sub type, so they can go in one call. Returns a list of data.
     """
-    data = {}
+    data = []
+    names = ", ".join(r["name"])
     if r["sub_type"] == "instance":
-        filtered_attributes = [
-            "InstanceType",
-            "PrivateIpAddress",
-            "SecurityGroups",
-            "SubnetId",
-            "VpcId",
-        ]
-        print(f"Querying EC2 instance {r['name']}") if cli_args.verbose else None
-        response = client.describe_instances(InstanceIds=[r["name"]])
-        if cli_args.full:
-            data = response["Reservations"][0]["Instances"][0]
-        else:
-            data = {
-                n: response["Reservations"][0]["Instances"][0][n]
-                for n in response["Reservations"][0]["Instances"][0]
-                if n in filtered_attributes
-            }
+        print(f"Querying EC2 instance {names}") if cli_args.verbose else None
+        response = cached_call(
+            client, "describe_instances", cli_args, InstanceIds=r["name"]
+        )
+        attributes = EC2_INSTANCE_ATTRIBUTES
+        if len(r["name"]) > 1:
+            # So the output for each instance can be told apart.
+            attributes = ("InstanceId",) + attributes
+        for reservation in response["Reservations"]:
+            for instance in reservation["Instances"]:
+                if cli_args.full:
+                    data.append(instance)
+                else:
+                    data.append({n: instance[n] for n in attributes if n in instance})
     elif r["sub_type"] == "subnet":
-        print(f"Querying subnet {r['name']}") if cli_args.verbose else None
-        response = client.describe_subnets(
-            SubnetIds=[
-                r["name"],
-            ]
+        print(f"Querying subnet {names}") if cli_args.verbose else None
+        response = cached_call(
+            client, "describe_subnets", cli_args, SubnetIds=r["name"]
         )
-        data = response["Subnets"][0]
+        data = response["Subnets"]
     elif r["sub_type"] == "vpc":
-        print(f"Querying vpc {r['name']}") if cli_args.verbose else None
+        print(f"Querying vpc {names}") if cli_args.verbose else None
 
-        response = client.describe_vpcs(
-            VpcIds=[
-                r["name"],
-            ]
-        )
-        data = response["Vpcs"][0]
+        response = cached_call(client, "describe_vpcs", cli_args, VpcIds=r["name"])
+        data = response["Vpcs"]
     elif r["sub_type"] == "volume":
-        print(f"Querying EBS volume {r['name']}") if cli_args.verbose else None
-        response = client.describe_volumes(
-            VolumeIds=[
-                r["name"],
-            ]
+        print(f"Querying EBS volume {names}") if cli_args.verbose else None
+        response = cached_call(
+            client, "describe_volumes", cli_args, VolumeIds=r["name"]
         )
-        data = response["Volumes"][0]
+        data = response["Volumes"]
     elif r["sub_type"] == "snapshot":
-        print(f"Querying EBS snapshot {r['name']}") if cli_args.verbose else None
-        response = client.describe_snapshots(
-            SnapshotIds=[
-                r["name"],
-            ]
+        print(f"Querying EBS snapshot {names}") if cli_args.verbose else None
+        response = cached_call(
+            client, "describe_snapshots", cli_args, SnapshotIds=r["name"]
         )
-        data = response["Snapshots"][0]
+        data = response["Snapshots"]
+    else:
+        print_err(f"Unknown EC2 thing: {r['sub_type']}")
+        sys.exit(2)
     return data
 
 
+def describe_resources(resources, args):
+    """
+    Describe all the resources we were given. ec2 resources of the same sub
+    type are batched into one describe call.
+    """
+    batched = []
+    ec2_batches = {}
+    for resource in resources:
+        if resource["type"] != "ec2":
+            batched.append(resource)
+        elif resource["sub_type"] in ec2_batches:
+            if resource["name"] not in ec2_batches[resource["sub_type"]]["name"]:
+                ec2_batches[resource["sub_type"]]["name"].append(resource["name"])
+        else:
+            ec2_batches[resource["sub_type"]] = dict(resource, name=[resource["name"]])
+            batched.append(ec2_batches[resource["sub_type"]])
+    for resource in batched:
+        describe_resource(resource, args)
+
+
 def describe_resource(resource, args):
     """Describe the resource that we were given"""
-    aws_config = Config()
-    if args.region is not None:
-        aws_config = Config(region_name=args.region)
+    import botocore.exceptions
+
     if resource["type"] == "ec2":
-        client = boto3.client("ec2", config=aws_config)
-        ec2_data = describe_ec2_resource(client=client, r=resource, cli_args=args)
-        print_json(ec2_data)
+        client = get_client("ec2", args.region, args.profile)
+        for ec2_data in describe_ec2_resource(client=client, r=resource, cli_args=args):
+            print_json(ec2_data)
     elif resource["type"] == "s3":
-        client = boto3.client("s3", config=aws_config)
-        bucket_name = (
-            resource["name"]
-            if resource["sub_type"] == "bucket"
-            else resource["name"][0]
-        )
-        region = (
-            client.get_bucket_location(Bucket=bucket_name)["LocationConstraint"]
-            or "us-east-1"
-        )
+        client = get_client("s3", args.region, args.profile)
         if resource["sub_type"] == "bucket":
             bucket = {"name": resource["name"]}
-            bucket["region"] = region
-            bucket["versioning"] = {
-                "status": client.get_bucket_versioning(Bucket=bucket["name"]).get(
-                    "Status", "Disabled"
+            # These don't depend on each other, so ask for them all at once.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                location = executor.submit(
+                    cached_call,
+                    client,
+                    "get_bucket_location",
+                    args,
+                    Bucket=bucket["name"],
                 )
+                versioning = executor.submit(
+                    cached_call,
+                    client,
+                    "get_bucket_versioning",
+                    args,
+                    Bucket=bucket["name"],
+                )
+                tagging = executor.submit(
+                    cached_call,
+                    client,
+                    "get_bucket_tagging",
+                    args,
+                    Bucket=bucket["name"],
+                )
+            bucket["region"] = location.result()["LocationConstraint"] or "us-east-1"
+            bucket["versioning"] = {
+                "status": versioning.result().get("Status", "Disabled")
             }
             try:
-                bucket["tags"] = client.get_bucket_tagging(Bucket=bucket["name"])[
-                    "TagSet"
-                ]
+                bucket["tags"] = tagging.result()["TagSet"]
             except botocore.exceptions.ClientError:
                 bucket["tags"] = {}
             print_json(bucket)
         elif resource["sub_type"] == "object":
             bucket = resource["name"][0]
             object_key = resource["name"][1]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                location = executor.submit(
+                    cached_call, client, "get_bucket_location", args, Bucket=bucket
+                )
+                head = executor.submit(
+                    cached_call,
+                    client,
+                    "head_object",
+                    args,
+                    Bucket=bucket,
+                    Key=object_key,
+                )
+            region = location.result()["LocationConstraint"] or "us-east-1"
             bucket_object = {"bucket": bucket, "key": object_key, "region": region}
-            bucket_object.update(client.head_object(Bucket=bucket, Key=object_key))
+            bucket_object.update(head.result())
             print_json(bucket_object)
         else:
             print_err("Unknown S3 thing")
@@ -309,16 +582,24 @@ def describe_resource(resource, args):
         if resource["sub_type"] == "record":
             print_json(resource["data"])
         else:
-            client = boto3.client("route53")
+            client = get_client("route53", profile=args.profile)
             route53_data = describe_route53_resource(
                 client=client, r=resource, cli_args=args
             )
             print_json(route53_data)
 
 
+def non_negative_int(value):
+    """argparse type for counts that can't be below zero"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is negative")
+    return number
+
+
 def main():
     """The main ting"""
-    my_parser = argparse.ArgumentParser(description="Describe a given AWS resource.")
+    my_parser = argparse.ArgumentParser(description="Describe given AWS resources.")
     my_parser.set_defaults(dry_run=False, full=False, verbose=False)
     my_parser.add_argument("--dry-run", dest="dry_run", action="store_true")
     my_parser.add_argument("--verbose", action="store_true")
@@ -329,8 +610,9 @@ def main():
     my_parser.add_argument(
         "identifier",
         action="store",
+        nargs="+",
         type=str,
-        help="identifier for the resource, a name or ARN",
+        help="identifiers for the resources, names or ARNs",
     )
     my_parser.add_argument(
         "--profile",
@@ -338,6 +620,15 @@ def main():
         type=str,
         help="Specify an awscli profile to use for this query.",
     )
+    my_parser.add_argument(
+        "--cache-ttl",
+        dest="cache_ttl",
+        action="store",
+        type=non_negative_int,
+        default=60,
+        help="""Reuse responses cached on disk for this many seconds.
+                0 turns the cache off.""",
+    )
     my_parser.add_argument(
         "--region",
         action="store",
@@ -349,23 +640,32 @@ def main():
 
     args = my_parser.parse_args()
 
-    if args.profile is not None:
-        boto3.setup_default_session(profile_name=args.profile)
+    import botocore.exceptions
+
+    # No up front credential check, let the real calls tell us.
     try:
-        iam = boto3.client("iam")
-        iam.get_account_summary()
-    except (botocore.exceptions.ClientError, botocore.exceptions.NoCredentialsError):
+        resources = [
+            determine_resource_type(identifier, args) for identifier in args.identifier
+        ]
+        if args.verbose or args.dry_run:
+            for resource in resources:
+                print(
+                    f"Resource : type = {resource['type']}, "
+                    f"sub type = {resource['sub_type']}, name = {resource['name']}"
+                )
+        if not args.dry_run:
+            describe_resources(resources, args)
+    except (
+        botocore.exceptions.NoCredentialsError,
+        botocore.exceptions.PartialCredentialsError,
+    ):
         print_err("Set up AWS credentials or profile in your environment.")
         sys.exit(1)
-
-    resource = determine_resource_type(args)
-    if args.verbose or args.dry_run:
-        print(
-            f"Resource : type = {resource['type']}, sub type = {resource['sub_type']},"
-            f" name = {resource['name']}"
-        )
-    if not args.dry_run:
-        describe_resource(resource, args)
+    except botocore.exceptions.ClientError as e:
+        if e.response["Error"]["Code"] in CREDENTIAL_ERROR_CODES:
+            print_err("Set up AWS credentials or profile in your environment.")
+            sys.exit(1)
+        raise
 
 
 if __name__ == "__main__":